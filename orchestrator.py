@@ -13,7 +13,7 @@ import json
 import re
 import sys
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, Iterator, List, Optional, Pattern, Sequence, Tuple
 
 SUPPORTED_ACTIONS = {
     "run_app",
@@ -35,8 +35,95 @@ SUPPORTED_ACTIONS = {
     "none",
 }
 
+_ELLIPSIS = "…"
+
+# Literal substrings a handler requires before it looks any further; _INTENT_GATE
+# is assembled from these, so every handler must take its triggers from here.
+_TRIGGERS_RUN_APP = ("відкрий", "запусти")
+_TRIGGERS_FOCUS_WINDOW = ("перемкнись", "переключись", "перейди")
+_TRIGGERS_HOTKEY = ("натисни", "натиснути")
+_TRIGGERS_MUTE = ("вимкни звук", "без звуку")
+_TRIGGERS_VOLUME = ("гучніше", "тихіше")
+_TRIGGERS_SYSTEM_TOGGLE = ("увімкни", "вимкни")
+_TRIGGERS_OPEN_FOLDER = ("відкрий папку",)
+_TRIGGERS_FILE_SEARCH = ("знайди файл",)
+_TRIGGERS_FILE_LIST = ("покажи файли за",)
+_TRIGGERS_MKDIR = ("створи папку",)
+_TRIGGERS_OPEN_RECENT = ("відкрий останній файл",)
+_TRIGGERS_TEXT_INPUT = ("вставити текст", "встави текст")
+_TRIGGERS_WEB_SEARCH = ("пошук", "знайди")
+_TRIGGERS_SPEAK_RESULTS = ("озвуч результати", "прочитай результати")
+_TRIGGERS_MACRO = ("увімкни режим", "увімкнути режим")
+_TRIGGERS_LLM_SUMMARIZE = ("узагальни", "підсумуй")
+_TRIGGERS_LLM_QUERY = ("поясни", "що таке", "розкажи")
+
+_RE_RUN_APP = re.compile(r"\b(відкрий|запусти)\s+(.+)")
+_RE_FOCUS_WINDOW = re.compile(r"\b(перемкнись|переключись|перейди)\s+на\s+(.+)")
+_RE_HOTKEY = re.compile(r"натисн(и|ути)\s+([a-zа-я0-9+\s]+)")
+_RE_VOLUME = re.compile(r"(гучніше|тихіше)\s+на\s+(\d+)%")
+_RE_OPEN_FOLDER = re.compile(r"відкрий папку\s+(.+)")
+_RE_FILE_SEARCH = re.compile(r"знайди файл\s+(.+)")
+_RE_FILE_LIST_DAYS = re.compile(r"покажи файли за останні\s+(\d+)\s+дні")
+_RE_MKDIR = re.compile(r"створи папку\s+(.+)\s+тут")
+_RE_TEXT_INPUT = re.compile(r"встав(ити|и) текст:?\s+(.+)")
+_RE_WEB_SEARCH = re.compile(r"(пошук|знайди)\s+(в інтернеті:|в інтернеті|:)\s*(.+)")
+_RE_MACRO = re.compile(r"увімкн(и|ути) режим\s+(.+)")
+_RE_DELETE_FILE = re.compile(r"видали файл\s+(.+)")
+_SYSTEM_TOGGLES: Dict[str, str] = {
+    "wi-fi": "wifi",
+    "вайфай": "wifi",
+    "bluetooth": "bluetooth",
+    "режим польоту": "airplane_mode",
+}
+_RE_SYSTEM_TOGGLE = re.compile(
+    "(" + "|".join(_TRIGGERS_SYSTEM_TOGGLE) + r")\s+("
+    + "|".join(re.escape(phrase) for phrase in _SYSTEM_TOGGLES)
+    + ")"
+)
+# Fixed phrases mapped to (keys, tts) without going through "натисни ...".
+_HOTKEY_PHRASES: Tuple[Tuple[Tuple[str, ...], Tuple[str, ...], str], ...] = (
+    (("закрий вікно",), ("alt", "f4"), "Закриваю активне вікно."),
+    (("згорни всі вікна", "робочий стіл"), ("win", "d"), "Показую робочий стіл."),
+)
+_RE_LLM_QUERY: Tuple[Pattern[str], ...] = tuple(
+    re.compile(pattern)
+    for pattern in (r"поясни\s+(.+)", r"що таке\s+(.+)", r"розкажи\s+про\s+(.+)")
+)
+
+# Trigger literals per intent. The handler-skipping gate and the leading-verb
+# dispatch table below are both derived from this map.
+_INTENT_TRIGGERS: Dict[str, Tuple[str, ...]] = {
+    "run_app": _TRIGGERS_RUN_APP,
+    "focus_window": _TRIGGERS_FOCUS_WINDOW,
+    "hotkey": _TRIGGERS_HOTKEY
+    + tuple(phrase for phrases, _keys, _tts in _HOTKEY_PHRASES for phrase in phrases),
+    "audio_control": _TRIGGERS_MUTE + _TRIGGERS_VOLUME,
+    "system_toggle": _TRIGGERS_SYSTEM_TOGGLE,
+    "open_folder": _TRIGGERS_OPEN_FOLDER,
+    "file_search": _TRIGGERS_FILE_SEARCH,
+    "file_list": _TRIGGERS_FILE_LIST,
+    "mkdir_here": _TRIGGERS_MKDIR,
+    "open_recent": _TRIGGERS_OPEN_RECENT,
+    "text_input": _TRIGGERS_TEXT_INPUT,
+    "web_search": _TRIGGERS_WEB_SEARCH,
+    "speak_results": _TRIGGERS_SPEAK_RESULTS,
+    "run_macro": _TRIGGERS_MACRO,
+    "llm_summarize": _TRIGGERS_LLM_SUMMARIZE,
+    "llm_query": _TRIGGERS_LLM_QUERY,
+}
 
-@dataclass
+# Every literal some intent handler needs; transcripts without any of them
+# cannot match a handler and skip the handler loop altogether.
+_INTENT_GATE = re.compile(
+    "|".join(
+        re.escape(trigger)
+        for triggers in _INTENT_TRIGGERS.values()
+        for trigger in triggers
+    )
+)
+
+
+@dataclass(frozen=True)
 class PolicyGate:
     name: str
     allowed: bool
@@ -67,7 +154,7 @@ def _apply_tts_limit(text: str, max_chars: Optional[int]) -> str:
     if max_chars is None or len(text) <= max_chars:
         return text
     truncated = text[: max_chars - 1].rstrip()
-    return truncated + "…"
+    return truncated + _ELLIPSIS
 
 
 def _resolve_dict(entries: List[Dict[str, Any]], name: str) -> Optional[Dict[str, Any]]:
@@ -75,7 +162,7 @@ def _resolve_dict(entries: List[Dict[str, Any]], name: str) -> Optional[Dict[str
     for entry in entries:
         for key in ("name", "title", "label"):
             value = entry.get(key)
-            if value and value.lower() == name_lower:
+            if value and isinstance(value, str) and value.lower() == name_lower:
                 return entry
     return None
 
@@ -85,30 +172,37 @@ def _match_alias(aliases: List[Dict[str, Any]], spoken: str) -> Optional[str]:
     for alias in aliases:
         name = alias.get("name")
         target = alias.get("maps_to")
-        if name and target and name.lower() == spoken_lower:
+        if (
+            name
+            and target
+            and isinstance(name, str)
+            and isinstance(target, str)
+            and name.lower() == spoken_lower
+        ):
             return target
     return None
 
 
-def _policy_gate_checks(action: str, policies: Dict[str, Any]) -> List[PolicyGate]:
-    mapping = {
-        "run_app": PolicyGate("allow_run_apps", True, "policy_violation"),
-        "focus_window": PolicyGate("allow_run_apps", True, "policy_violation"),
-        "hotkey": PolicyGate("allow_hotkeys", True, "policy_violation"),
-        "audio_control": PolicyGate("allow_audio", True, "policy_violation"),
-        "system_toggle": PolicyGate("allow_system_toggle", True, "policy_violation"),
-        "open_folder": PolicyGate("allow_file_ops", True, "policy_violation"),
-        "file_search": PolicyGate("allow_file_ops", True, "policy_violation"),
-        "file_list": PolicyGate("allow_file_ops", True, "policy_violation"),
-        "mkdir_here": PolicyGate("allow_file_ops", True, "policy_violation"),
-        "open_recent": PolicyGate("allow_file_ops", True, "policy_violation"),
-        "text_input": PolicyGate("dictation", True, "policy_violation"),
-        "web_search": PolicyGate("allow_network_search", True, "policy_violation"),
-        "llm_query": PolicyGate("allow_llm_query", True, "policy_violation"),
-        "llm_summarize": PolicyGate("allow_llm_summarize", True, "policy_violation"),
-    }
+_POLICY_GATES: Dict[str, PolicyGate] = {
+    "run_app": PolicyGate("allow_run_apps", True, "policy_violation"),
+    "focus_window": PolicyGate("allow_run_apps", True, "policy_violation"),
+    "hotkey": PolicyGate("allow_hotkeys", True, "policy_violation"),
+    "audio_control": PolicyGate("allow_audio", True, "policy_violation"),
+    "system_toggle": PolicyGate("allow_system_toggle", True, "policy_violation"),
+    "open_folder": PolicyGate("allow_file_ops", True, "policy_violation"),
+    "file_search": PolicyGate("allow_file_ops", True, "policy_violation"),
+    "file_list": PolicyGate("allow_file_ops", True, "policy_violation"),
+    "mkdir_here": PolicyGate("allow_file_ops", True, "policy_violation"),
+    "open_recent": PolicyGate("allow_file_ops", True, "policy_violation"),
+    "text_input": PolicyGate("dictation", True, "policy_violation"),
+    "web_search": PolicyGate("allow_network_search", True, "policy_violation"),
+    "llm_query": PolicyGate("allow_llm_query", True, "policy_violation"),
+    "llm_summarize": PolicyGate("allow_llm_summarize", True, "policy_violation"),
+}
+
 
-    gate = mapping.get(action)
+def _policy_gate_checks(action: str, policies: Dict[str, Any]) -> List[PolicyGate]:
+    gate = _POLICY_GATES.get(action)
     if not gate:
         return []
 
@@ -127,10 +221,11 @@ def _set_policy_checks(response: Dict[str, Any], gates: List[PolicyGate]) -> Non
 def _deny_for_policy(response: Dict[str, Any], gates: List[PolicyGate]) -> bool:
     for gate in gates:
         if not gate.allowed:
+            log = response["log"]
             response["action"] = "none"
             response["params"] = {}
-            response["log"]["errors"].append(gate.deny_action)
-            response["log"]["resolution"] = {"denied_policy": gate.name}
+            log["errors"].append(gate.deny_action)
+            log["resolution"] = {"denied_policy": gate.name}
             return True
     return False
 
@@ -139,13 +234,28 @@ def _make_confirmation(response: Dict[str, Any], phrase: str) -> None:
     response["confirmation"] = {"required": True, "phrase": phrase}
 
 
+def _apply_intent_result(response: Dict[str, Any], intent: str, result: "IntentResult") -> None:
+    response["action"] = result.action
+    response["params"] = result.params
+    response["need_more_info"] = result.need_more_info
+    if result.confirmation_phrase:
+        _make_confirmation(response, result.confirmation_phrase)
+    log = response["log"]
+    log["intent_detected"] = intent
+    log["confidence"] = result.confidence
+    log["slots"] = result.slots
+    if result.resolution:
+        log["resolution"] = result.resolution
+
+
 def process_request(payload: Dict[str, Any]) -> Dict[str, Any]:
     """Process a single orchestrator request."""
 
     response = _base_response()
+    log = response["log"]
 
-    policies = payload.get("policies", {}) or {}
-    tts_max = payload.get("policies", {}).get("tts_max_chars") if policies else None
+    policies = payload.get("policies") or {}
+    tts_max = policies.get("tts_max_chars")
 
     state = payload.get("state", "passive")
     transcript = (payload.get("transcript") or "").strip()
@@ -157,134 +267,98 @@ def process_request(payload: Dict[str, Any]) -> Dict[str, Any]:
         response["tts"]["say"] = _apply_tts_limit(
             "Активуйте мене кодовою фразою, щоб виконати команду.", tts_max
         )
-        response["log"]["intent_detected"] = "idle"
-        response["log"]["confidence"] = 1.0
+        log["intent_detected"] = "idle"
+        log["confidence"] = 1.0
         return response
 
     if llm_summary and not transcript:
         response["action"] = "speak_results"
         response["params"] = {"source": "llm_summary"}
         response["tts"]["say"] = _apply_tts_limit(str(llm_summary), tts_max)
-        response["log"]["intent_detected"] = "speak_results"
-        response["log"]["confidence"] = 1.0
-        response["log"]["resolution"] = {"source": "llm_summary"}
+        log["intent_detected"] = "speak_results"
+        log["confidence"] = 1.0
+        log["resolution"] = {"source": "llm_summary"}
         return response
 
     normalized = transcript.lower()
 
-    prechecked = _run_intents(normalized, payload)
+    # Critical operations are checked before any other intent.
+    prechecked = _handle_critical_wrapper(normalized)
     if prechecked:
-        response.update(prechecked.response)
-        response["log"]["intent_detected"] = "critical"
-        response["log"]["confidence"] = prechecked.confidence
-        response["log"]["slots"] = prechecked.slots
-        if prechecked.resolution:
-            response["log"]["resolution"] = prechecked.resolution
+        _apply_intent_result(response, "critical", prechecked)
         response["tts"]["say"] = _apply_tts_limit(prechecked.tts, tts_max)
         return response
 
     if not transcript:
         response["need_more_info"] = "Потрібна голосова команда."
-        response["log"]["intent_detected"] = "missing_transcript"
-        response["log"]["confidence"] = 0.1
+        log["intent_detected"] = "missing_transcript"
+        log["confidence"] = 0.1
         return response
-    
-
-    apps = payload.get("apps", []) or []
-    windows = payload.get("windows", []) or []
-    folders = payload.get("folders", []) or []
-    macros = payload.get("macros", []) or []
-    aliases = payload.get("aliases", []) or []
 
     # Command detection
-    intent_handlers: List[Tuple[str, Any]] = [
-        ("run_app", _handle_run_app),
-        ("focus_window", _handle_focus_window),
-        ("hotkey", _handle_hotkey),
-        ("audio_control", _handle_audio_control),
-        ("system_toggle", _handle_system_toggle),
-        ("open_folder", _handle_open_folder),
-        ("file_search", _handle_file_search),
-        ("file_list", _handle_file_list),
-        ("mkdir_here", _handle_mkdir_here),
-        ("open_recent", _handle_open_recent),
-        ("text_input", _handle_text_input),
-        ("web_search", _handle_web_search),
-        ("speak_results", _handle_speak_results),
-        ("run_macro", _handle_run_macro),
-        ("llm_summarize", _handle_llm_summarize),
-        ("llm_query", _handle_llm_query),
-    ]
-
-    for intent, handler in intent_handlers:
-        result = handler(
-            normalized,
-            payload,
-            apps=apps,
-            windows=windows,
-            folders=folders,
-            macros=macros,
-            aliases=aliases,
-            result_set=result_set,
-        )
-        if result:
-            response.update(result.response)
-            response["log"]["intent_detected"] = intent
-            response["log"]["confidence"] = result.confidence
-            response["log"]["slots"] = result.slots
-            if result.resolution:
-                response["log"]["resolution"] = result.resolution
-
-            gates = _policy_gate_checks(response["action"], policies)
-            _set_policy_checks(response, gates)
-            if _deny_for_policy(response, gates):
-                response["tts"]["say"] = _apply_tts_limit(
-                    "Цю дію заборонено політиками.", tts_max
-                )
-            else:
-                response["tts"]["say"] = _apply_tts_limit(
-                    result.tts or response["tts"].get("say", ""), tts_max
-                )
-            return response
+    if _INTENT_GATE.search(normalized):
+        apps = payload.get("apps", []) or []
+        windows = payload.get("windows", []) or []
+        folders = payload.get("folders", []) or []
+        macros = payload.get("macros", []) or []
+        aliases = payload.get("aliases", []) or []
+        first_word = normalized.split(None, 1)[0]
+        handlers = _VERB_DISPATCH.get(first_word, INTENT_HANDLERS)
+        for intent, handler in handlers:
+            result = handler(
+                normalized,
+                payload,
+                apps=apps,
+                windows=windows,
+                folders=folders,
+                macros=macros,
+                aliases=aliases,
+                result_set=result_set,
+            )
+            if result:
+                _apply_intent_result(response, intent, result)
+
+                gates = _policy_gate_checks(response["action"], policies)
+                _set_policy_checks(response, gates)
+                if _deny_for_policy(response, gates):
+                    response["tts"]["say"] = _apply_tts_limit(
+                        "Цю дію заборонено політиками.", tts_max
+                    )
+                else:
+                    response["tts"]["say"] = _apply_tts_limit(result.tts, tts_max)
+                return response
 
     response["tts"]["say"] = _apply_tts_limit(
         "Не розпізнала команду. Спробуйте інакше сформулювати запит.", tts_max
     )
-    response["log"]["intent_detected"] = "unknown"
-    response["log"]["confidence"] = 0.2
-    response["log"]["errors"].append("intent_not_found")
+    log["intent_detected"] = "unknown"
+    log["confidence"] = 0.2
+    log["errors"].append("intent_not_found")
     return response
 
 
 @dataclass
 class IntentResult:
-    response: Dict[str, Any]
+    action: str
+    params: Dict[str, Any]
     confidence: float
     slots: Dict[str, Any]
     tts: str = ""
     resolution: Optional[Dict[str, Any]] = None
+    need_more_info: str = ""
+    confirmation_phrase: str = ""
 
 
-def _intent_response(action: str, params: Dict[str, Any]) -> Dict[str, Any]:
-    return {
-        "action": action,
-        "params": params,
-        "confirmation": {"required": False, "phrase": ""},
-        "tts": {"say": "", "display": ""},
-        "log": {
-            "intent_detected": "",
-            "confidence": 0.0,
-            "slots": {},
-            "policy_checks": [],
-            "resolution": {},
-            "errors": [],
-        },
-        "need_more_info": "",
-    }
+def _need_more_info(question: str, tts: str, slots: Dict[str, Any]) -> IntentResult:
+    """Build the no-action result a handler returns when it needs clarification."""
+
+    return IntentResult("none", {}, 0.4, slots, tts=tts, need_more_info=question)
 
 
 def _handle_run_app(transcript: str, payload: Dict[str, Any], **kwargs: Any) -> Optional[IntentResult]:
-    match = re.search(r"\b(відкрий|запусти)\s+(.+)", transcript)
+    if not any(t in transcript for t in _TRIGGERS_RUN_APP):
+        return None
+    match = _RE_RUN_APP.search(transcript)
     if not match:
         return None
 
@@ -296,76 +370,82 @@ def _handle_run_app(transcript: str, payload: Dict[str, Any], **kwargs: Any) ->
     app = _resolve_dict(apps, target_name)
 
     if not app:
-        response = _intent_response("none", {})
-        response["need_more_info"] = "Не знайшла додаток. Уточніть назву."
-        return IntentResult(response, 0.4, {"app": spoken}, tts="Не знайшла такого додатка.")
+        return _need_more_info(
+            "Не знайшла додаток. Уточніть назву.", "Не знайшла такого додатка.", {"app": spoken}
+        )
 
     params = {
         "app": app.get("name", target_name),
         "path": app.get("path"),
     }
     resolution = {"app_id": app.get("id"), "spoken": spoken}
-    response = _intent_response("run_app", params)
     tts = f"Запускаю {params['app']}."
-    return IntentResult(response, 0.85, {"app": params["app"]}, tts=tts, resolution=resolution)
+    return IntentResult(
+        "run_app", params, 0.85, {"app": params["app"]},
+        tts=tts,
+        resolution=resolution,
+    )
 
 
 def _handle_focus_window(transcript: str, payload: Dict[str, Any], **kwargs: Any) -> Optional[IntentResult]:
-    match = re.search(r"\b(перемкнись|переключись|перейди)\s+на\s+(.+)", transcript)
+    if not any(t in transcript for t in _TRIGGERS_FOCUS_WINDOW):
+        return None
+    match = _RE_FOCUS_WINDOW.search(transcript)
     if not match:
         return None
 
     spoken = match.group(2).strip()
-    windows = kwargs.get("windows", [])
-    target = _resolve_dict(windows, spoken)
+    target = _resolve_dict(kwargs.get("windows", []), spoken)
 
     if not target:
-        response = _intent_response("none", {})
-        response["need_more_info"] = "Не знайшла вікно. Уточніть назву."
-        return IntentResult(response, 0.4, {"window": spoken}, tts="Не знайшла такого вікна.")
+        return _need_more_info(
+            "Не знайшла вікно. Уточніть назву.", "Не знайшла такого вікна.", {"window": spoken}
+        )
 
     params = {"window": target.get("name", spoken), "id": target.get("id")}
     resolution = {"window_id": target.get("id"), "spoken": spoken}
-    response = _intent_response("focus_window", params)
     tts = f"Перемикаюся на {params['window']}."
-    return IntentResult(response, 0.8, {"window": params["window"]}, tts=tts, resolution=resolution)
+    return IntentResult(
+        "focus_window", params, 0.8, {"window": params["window"]},
+        tts=tts,
+        resolution=resolution,
+    )
+
+
+def _format_keys(keys: Sequence[str]) -> str:
+    return "+".join(k.title() for k in keys)
 
 
 def _handle_hotkey(transcript: str, payload: Dict[str, Any], **kwargs: Any) -> Optional[IntentResult]:
-    if "закрий вікно" in transcript:
-        params = {"keys": ["alt", "f4"]}
-        response = _intent_response("hotkey", params)
-        tts = "Закриваю активне вікно."
-        return IntentResult(response, 0.9, {"keys": "Alt+F4"}, tts=tts)
-
-    if "згорни всі вікна" in transcript or "робочий стіл" in transcript:
-        params = {"keys": ["win", "d"]}
-        response = _intent_response("hotkey", params)
-        tts = "Показую робочий стіл."
-        return IntentResult(response, 0.9, {"keys": "Win+D"}, tts=tts)
-
-    match = re.search(r"натисн(и|ути)\s+([a-zа-я0-9+\s]+)", transcript)
+    for phrases, keys, tts in _HOTKEY_PHRASES:
+        if any(phrase in transcript for phrase in phrases):
+            params = {"keys": list(keys)}
+            return IntentResult("hotkey", params, 0.9, {"keys": _format_keys(keys)}, tts=tts)
+
+    if not any(t in transcript for t in _TRIGGERS_HOTKEY):
+        return None
+    match = _RE_HOTKEY.search(transcript)
     if match:
         combo = match.group(2)
-        keys = [k.strip().lower() for k in re.split(r"[+ ]", combo) if k.strip()]
+        keys = [k.lower() for k in combo.replace("+", " ").split()]
         if not keys:
             return None
         params = {"keys": keys}
-        response = _intent_response("hotkey", params)
         tts = "Натискаю комбінацію клавіш."
-        return IntentResult(response, 0.7, {"keys": "+".join(k.title() for k in keys)}, tts=tts)
+        return IntentResult("hotkey", params, 0.7, {"keys": _format_keys(keys)}, tts=tts)
 
     return None
 
 
 def _handle_audio_control(transcript: str, payload: Dict[str, Any], **kwargs: Any) -> Optional[IntentResult]:
-    if "вимкни звук" in transcript or "без звуку" in transcript:
+    if any(t in transcript for t in _TRIGGERS_MUTE):
         params = {"operation": "mute"}
-        response = _intent_response("audio_control", params)
         tts = "Вимикаю звук."
-        return IntentResult(response, 0.9, {}, tts=tts)
+        return IntentResult("audio_control", params, 0.9, {}, tts=tts)
 
-    match = re.search(r"(гучніше|тихіше)\s+на\s+(\d+)%", transcript)
+    if not any(t in transcript for t in _TRIGGERS_VOLUME):
+        return None
+    match = _RE_VOLUME.search(transcript)
     if match:
         direction = match.group(1)
         value = int(match.group(2))
@@ -373,111 +453,117 @@ def _handle_audio_control(transcript: str, payload: Dict[str, Any], **kwargs: An
             "operation": "volume_up" if direction == "гучніше" else "volume_down",
             "amount": value,
         }
-        response = _intent_response("audio_control", params)
         tts = f"Регулюю гучність на {value}%"
-        return IntentResult(response, 0.85, {"amount": value, "direction": direction}, tts=tts)
+        return IntentResult(
+            "audio_control", params, 0.85, {"amount": value, "direction": direction},
+            tts=tts,
+        )
 
     return None
 
 
 def _handle_system_toggle(transcript: str, payload: Dict[str, Any], **kwargs: Any) -> Optional[IntentResult]:
-    toggles = {
-        "wi-fi": "wifi",
-        "вайфай": "wifi",
-        "bluetooth": "bluetooth",
-        "режим польоту": "airplane_mode",
-    }
-    for phrase, feature in toggles.items():
-        if f"увімкни {phrase}" in transcript:
-            params = {"feature": feature, "state": "on"}
-        elif f"вимкни {phrase}" in transcript:
-            params = {"feature": feature, "state": "off"}
-        else:
-            continue
-        response = _intent_response("system_toggle", params)
-        tts = f"Перемикаю {phrase}."
-        return IntentResult(response, 0.85, {"feature": feature, "state": params["state"]}, tts=tts)
-    return None
+    match = _RE_SYSTEM_TOGGLE.search(transcript)
+    if not match:
+        return None
+
+    verb, phrase = match.group(1), match.group(2)
+    feature = _SYSTEM_TOGGLES[phrase]
+    params = {"feature": feature, "state": "on" if verb == "увімкни" else "off"}
+    tts = f"Перемикаю {phrase}."
+    return IntentResult(
+        "system_toggle", params, 0.85, {"feature": feature, "state": params["state"]},
+        tts=tts,
+    )
 
 
 def _handle_open_folder(transcript: str, payload: Dict[str, Any], **kwargs: Any) -> Optional[IntentResult]:
-    match = re.search(r"відкрий папку\s+(.+)", transcript)
+    if not any(t in transcript for t in _TRIGGERS_OPEN_FOLDER):
+        return None
+    match = _RE_OPEN_FOLDER.search(transcript)
     if not match:
         return None
 
     spoken = match.group(1).strip()
-    folders = kwargs.get("folders", [])
-    folder = _resolve_dict(folders, spoken)
+    folder = _resolve_dict(kwargs.get("folders", []), spoken)
     if not folder:
-        response = _intent_response("none", {})
-        response["need_more_info"] = "Не знайшла папку. Уточніть назву."
-        return IntentResult(response, 0.4, {"folder": spoken}, tts="Не знайшла таку папку.")
+        return _need_more_info(
+            "Не знайшла папку. Уточніть назву.", "Не знайшла таку папку.", {"folder": spoken}
+        )
 
     params = {"path": folder.get("path"), "name": folder.get("name", spoken)}
-    response = _intent_response("open_folder", params)
     resolution = {"folder_path": folder.get("path"), "spoken": spoken}
     tts = f"Відкриваю папку {params['name']}."
-    return IntentResult(response, 0.8, {"folder": params["name"]}, tts=tts, resolution=resolution)
+    return IntentResult(
+        "open_folder", params, 0.8, {"folder": params["name"]},
+        tts=tts,
+        resolution=resolution,
+    )
 
 
 def _handle_file_search(transcript: str, payload: Dict[str, Any], **kwargs: Any) -> Optional[IntentResult]:
-    match = re.search(r"знайди файл\s+(.+)", transcript)
+    if not any(t in transcript for t in _TRIGGERS_FILE_SEARCH):
+        return None
+    match = _RE_FILE_SEARCH.search(transcript)
     if not match:
         return None
     query = match.group(1).strip()
     params = {"query": query}
-    response = _intent_response("file_search", params)
     tts = f"Шукаю файли за запитом {query}."
-    return IntentResult(response, 0.75, {"query": query}, tts=tts)
+    return IntentResult("file_search", params, 0.75, {"query": query}, tts=tts)
 
 
 def _handle_file_list(transcript: str, payload: Dict[str, Any], **kwargs: Any) -> Optional[IntentResult]:
+    if not any(t in transcript for t in _TRIGGERS_FILE_LIST):
+        return None
     if "покажи файли за сьогодні" in transcript:
         params = {"time_filter": "today"}
     elif "покажи файли за вчора" in transcript:
         params = {"time_filter": "yesterday"}
     else:
-        match = re.search(r"покажи файли за останні\s+(\d+)\s+дні", transcript)
+        match = _RE_FILE_LIST_DAYS.search(transcript)
         if not match:
             return None
         params = {"time_filter": "last_n_days", "days": int(match.group(1))}
-    response = _intent_response("file_list", params)
     tts = "Показую відповідні файли."
-    return IntentResult(response, 0.7, params, tts=tts)
+    return IntentResult("file_list", params, 0.7, params, tts=tts)
 
 
 def _handle_mkdir_here(transcript: str, payload: Dict[str, Any], **kwargs: Any) -> Optional[IntentResult]:
-    match = re.search(r"створи папку\s+(.+)\s+тут", transcript)
+    if not any(t in transcript for t in _TRIGGERS_MKDIR):
+        return None
+    match = _RE_MKDIR.search(transcript)
     if not match:
         return None
     folder_name = match.group(1).strip()
     params = {"name": folder_name}
-    response = _intent_response("mkdir_here", params)
     tts = f"Створюю папку {folder_name}."
-    return IntentResult(response, 0.75, {"folder": folder_name}, tts=tts)
+    return IntentResult("mkdir_here", params, 0.75, {"folder": folder_name}, tts=tts)
 
 
 def _handle_open_recent(transcript: str, payload: Dict[str, Any], **kwargs: Any) -> Optional[IntentResult]:
-    if "відкрий останній файл" not in transcript:
+    if not any(t in transcript for t in _TRIGGERS_OPEN_RECENT):
         return None
-    response = _intent_response("open_recent", {})
     tts = "Відкриваю останній файл."
-    return IntentResult(response, 0.7, {}, tts=tts)
+    return IntentResult("open_recent", {}, 0.7, {}, tts=tts)
 
 
 def _handle_text_input(transcript: str, payload: Dict[str, Any], **kwargs: Any) -> Optional[IntentResult]:
-    match = re.search(r"встав(ити|и) текст:?\s+(.+)", transcript)
+    if not any(t in transcript for t in _TRIGGERS_TEXT_INPUT):
+        return None
+    match = _RE_TEXT_INPUT.search(transcript)
     if not match:
         return None
     text = match.group(2).strip()
     params = {"text": text}
-    response = _intent_response("text_input", params)
     tts = "Вставляю текст."
-    return IntentResult(response, 0.75, {"text": text}, tts=tts)
+    return IntentResult("text_input", params, 0.75, {"text": text}, tts=tts)
 
 
 def _handle_web_search(transcript: str, payload: Dict[str, Any], **kwargs: Any) -> Optional[IntentResult]:
-    match = re.search(r"(пошук|знайди)\s+(в інтернеті:|в інтернеті|:)\s*(.+)", transcript)
+    if not any(t in transcript for t in _TRIGGERS_WEB_SEARCH):
+        return None
+    match = _RE_WEB_SEARCH.search(transcript)
     if match:
         query = match.group(3).strip()
     elif transcript.startswith("пошук "):
@@ -487,71 +573,70 @@ def _handle_web_search(transcript: str, payload: Dict[str, Any], **kwargs: Any)
 
     engine = payload.get("default_search_engine", "google")
     params = {"engine": engine, "query": query}
-    response = _intent_response("web_search", params)
     tts = "Запускаю пошук."
-    return IntentResult(response, 0.8, {"query": query}, tts=tts)
+    return IntentResult("web_search", params, 0.8, {"query": query}, tts=tts)
 
 
 def _handle_speak_results(transcript: str, payload: Dict[str, Any], **kwargs: Any) -> Optional[IntentResult]:
-    if "озвуч результати" not in transcript and "прочитай результати" not in transcript:
+    if not any(t in transcript for t in _TRIGGERS_SPEAK_RESULTS):
         return None
 
     result_set = kwargs.get("result_set", [])
     if not result_set:
-        response = _intent_response("none", {})
-        response["need_more_info"] = "Немає результатів для озвучення."
-        return IntentResult(response, 0.4, {}, tts="Результати недоступні.")
+        return _need_more_info("Немає результатів для озвучення.", "Результати недоступні.", {})
 
     snippet = _summarize_result_set(result_set)
-    response = _intent_response("speak_results", {"source": "result_set"})
-    response["tts"]["say"] = snippet
-    return IntentResult(response, 0.8, {"items": len(result_set)}, tts=snippet)
+    return IntentResult(
+        "speak_results", {"source": "result_set"}, 0.8, {"items": len(result_set)},
+        tts=snippet,
+    )
 
 
-def _summarize_result_set(result_set: List[Dict[str, Any]]) -> str:
-    top_items = []
+def _iter_result_rows(result_set: List[Dict[str, Any]]) -> Iterator[str]:
     for item in result_set[:3]:
         title = item.get("title") or item.get("name")
         if not title:
             continue
         summary = item.get("snippet") or item.get("summary")
-        if summary:
-            top_items.append(f"{title}: {summary}")
-        else:
-            top_items.append(title)
-    if not top_items:
-        return "Результати без опису."
-    return "; ".join(top_items)
+        yield f"{title}: {summary}" if summary else title
+
+
+def _summarize_result_set(result_set: List[Dict[str, Any]]) -> str:
+    return "; ".join(_iter_result_rows(result_set)) or "Результати без опису."
 
 
 def _handle_run_macro(transcript: str, payload: Dict[str, Any], **kwargs: Any) -> Optional[IntentResult]:
-    match = re.search(r"увімкн(и|ути) режим\s+(.+)", transcript)
+    if not any(t in transcript for t in _TRIGGERS_MACRO):
+        return None
+    match = _RE_MACRO.search(transcript)
     if not match:
         return None
 
     spoken = match.group(2).strip()
-    macros = kwargs.get("macros", [])
-    macro = _resolve_dict(macros, spoken)
+    macro = _resolve_dict(kwargs.get("macros", []), spoken)
     if not macro:
-        response = _intent_response("none", {})
-        response["need_more_info"] = "Не знайшла макрос. Уточніть назву."
-        return IntentResult(response, 0.4, {"macro": spoken}, tts="Не знайшла такий режим.")
+        return _need_more_info(
+            "Не знайшла макрос. Уточніть назву.", "Не знайшла такий режим.", {"macro": spoken}
+        )
 
     params = {"macro_id": macro.get("id"), "name": macro.get("name", spoken)}
-    response = _intent_response("run_macro", params)
     resolution = {"macro_id": macro.get("id"), "spoken": spoken}
     tts = f"Активую режим {params['name']}."
-    return IntentResult(response, 0.8, {"macro": params["name"]}, tts=tts, resolution=resolution)
+    return IntentResult(
+        "run_macro", params, 0.8, {"macro": params["name"]},
+        tts=tts,
+        resolution=resolution,
+    )
 
 
 def _handle_llm_summarize(transcript: str, payload: Dict[str, Any], **kwargs: Any) -> Optional[IntentResult]:
-    if "узагальни" not in transcript and "підсумуй" not in transcript:
+    if not any(t in transcript for t in _TRIGGERS_LLM_SUMMARIZE):
         return None
 
     if not kwargs.get("result_set"):
-        response = _intent_response("none", {})
-        response["need_more_info"] = "Немає результатів для узагальнення."
-        return IntentResult(response, 0.4, {}, tts="Потрібні результати пошуку.")
+        return _need_more_info(
+            "Немає результатів для узагальнення.", "Потрібні результати пошуку.", {}
+        )
 
     params = {
         "source": "web_search",
@@ -559,16 +644,16 @@ def _handle_llm_summarize(transcript: str, payload: Dict[str, Any], **kwargs: An
         "style": "concise_voice_output",
         "context_keys": ["result_set"],
     }
-    response = _intent_response("llm_summarize", params)
     resolution = {"llm_context": "result_set"}
     tts = "Передаю результати для узагальнення."
-    return IntentResult(response, 0.8, {}, tts=tts, resolution=resolution)
+    return IntentResult("llm_summarize", params, 0.8, {}, tts=tts, resolution=resolution)
 
 
 def _handle_llm_query(transcript: str, payload: Dict[str, Any], **kwargs: Any) -> Optional[IntentResult]:
-    patterns = [r"поясни\s+(.+)", r"що таке\s+(.+)", r"розкажи\s+про\s+(.+)"]
-    for pattern in patterns:
-        match = re.search(pattern, transcript)
+    if not any(t in transcript for t in _TRIGGERS_LLM_QUERY):
+        return None
+    for pattern in _RE_LLM_QUERY:
+        match = pattern.search(transcript)
         if not match:
             continue
         topic = match.group(1).strip()
@@ -579,10 +664,13 @@ def _handle_llm_query(transcript: str, payload: Dict[str, Any], **kwargs: Any) -
                 f"Тема: {topic}"
             )
         }
-        response = _intent_response("llm_query", params)
         resolution = {"topic": topic}
         tts = "Запитую пояснення у мовної моделі."
-        return IntentResult(response, 0.75, {"topic": topic}, tts=tts, resolution=resolution)
+        return IntentResult(
+            "llm_query", params, 0.75, {"topic": topic},
+            tts=tts,
+            resolution=resolution,
+        )
 
     return None
 
@@ -593,7 +681,7 @@ def _handle_critical(transcript: str) -> Optional[Tuple[str, str, Dict[str, Any]
     if "перезавантаж" in transcript:
         return "restart", "Перезавантажити комп'ютер?", {"operation": "restart"}
     if "видали файл" in transcript:
-        match = re.search(r"видали файл\s+(.+)", transcript)
+        match = _RE_DELETE_FILE.search(transcript)
         if match:
             filename = match.group(1).strip()
             return "delete_file", f"Видалити файл {filename}?", {"file": filename}
@@ -605,22 +693,63 @@ def _handle_critical_wrapper(transcript: str) -> Optional[IntentResult]:
     if not critical:
         return None
     intent, phrase, params = critical
-    response = _intent_response("none", params)
-    _make_confirmation(response, phrase)
     tts = "Потрібне підтвердження."
-    return IntentResult(response, 0.8, params, tts=tts, resolution={"critical_intent": intent})
+    return IntentResult(
+        "none", params, 0.8, params,
+        tts=tts,
+        resolution={"critical_intent": intent},
+        confirmation_phrase=phrase,
+    )
 
 
-# Extend handler list with critical check at a higher priority
-INTENT_PRECHECKS = [_handle_critical_wrapper]
+# Intent handlers in priority order; the first one that matches wins.
+INTENT_HANDLERS: Tuple[Tuple[str, Callable[..., Optional[IntentResult]]], ...] = (
+    ("run_app", _handle_run_app),
+    ("focus_window", _handle_focus_window),
+    ("hotkey", _handle_hotkey),
+    ("audio_control", _handle_audio_control),
+    ("system_toggle", _handle_system_toggle),
+    ("open_folder", _handle_open_folder),
+    ("file_search", _handle_file_search),
+    ("file_list", _handle_file_list),
+    ("mkdir_here", _handle_mkdir_here),
+    ("open_recent", _handle_open_recent),
+    ("text_input", _handle_text_input),
+    ("web_search", _handle_web_search),
+    ("speak_results", _handle_speak_results),
+    ("run_macro", _handle_run_macro),
+    ("llm_summarize", _handle_llm_summarize),
+    ("llm_query", _handle_llm_query),
+)
 
 
-def _run_intents(transcript: str, payload: Dict[str, Any], **kwargs: Any) -> Optional[IntentResult]:
-    for handler in INTENT_PRECHECKS:
-        result = handler(transcript)
-        if result:
-            return result
-    return None
+def _verb_intents() -> Dict[str, Tuple[str, ...]]:
+    """Map the first word of every trigger to the intents that use it."""
+
+    verbs: Dict[str, List[str]] = {}
+    for intent, triggers in _INTENT_TRIGGERS.items():
+        for trigger in triggers:
+            intents = verbs.setdefault(trigger.split()[0], [])
+            if intent not in intents:
+                intents.append(intent)
+    return {verb: tuple(intents) for verb, intents in verbs.items()}
+
+
+# Leading verbs mapped to the intents they usually trigger.
+_TRIGGER_VERBS = _verb_intents()
+
+
+def _prioritize_handlers(
+    intents: Tuple[str, ...],
+) -> Tuple[Tuple[str, Callable[..., Optional[IntentResult]]], ...]:
+    """Move the given intents to the front, keeping the rest as a fallback."""
+
+    preferred = [entry for entry in INTENT_HANDLERS if entry[0] in intents]
+    remaining = [entry for entry in INTENT_HANDLERS if entry[0] not in intents]
+    return tuple(preferred + remaining)
+
+
+_VERB_DISPATCH = {verb: _prioritize_handlers(intents) for verb, intents in _TRIGGER_VERBS.items()}
 
 
 def main() -> int:
@@ -1,7 +1,10 @@
+import io
 import json
 import sys
 from pathlib import Path
 
+import pytest
+
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
 import orchestrator
@@ -99,3 +102,225 @@ def test_cli_roundtrip(tmp_path, monkeypatch, capsys):
     output = json.loads(captured.out)
     assert output["action"] == "web_search"
     assert output["params"]["query"] == "погода київ"
+
+
+def test_verb_dispatch_prefers_leading_verb():
+    payload = build_payload(transcript="Знайди файл звіт")
+    result = orchestrator.process_request(payload)
+    assert result["action"] == "file_search"
+    assert result["params"]["query"] == "звіт"
+
+
+def test_leading_verb_takes_precedence_over_handler_order():
+    # run_app comes before mkdir_here in INTENT_HANDLERS, but the leading
+    # verb "створи" picks mkdir_here first.
+    payload = build_payload(
+        transcript="Створи папку відкрий тут",
+        apps=[{"name": "тут"}],
+    )
+    result = orchestrator.process_request(payload)
+    assert result["action"] == "mkdir_here"
+    assert result["params"]["name"] == "відкрий"
+
+
+def test_verb_dispatch_falls_back_to_remaining_handlers():
+    payload = build_payload(transcript="Покажи робочий стіл")
+    result = orchestrator.process_request(payload)
+    assert result["action"] == "hotkey"
+    assert result["params"]["keys"] == ["win", "d"]
+
+
+def test_lookup_matches_title_and_keeps_first_entry():
+    payload = build_payload(
+        transcript="Перемкнись на Браузер",
+        windows=[
+            {"id": 1, "title": "Браузер"},
+            {"id": 2, "name": "браузер"},
+        ],
+    )
+    result = orchestrator.process_request(payload)
+    assert result["action"] == "focus_window"
+    assert result["params"]["id"] == 1
+
+
+def test_system_toggle_on_and_off():
+    result = orchestrator.process_request(build_payload(transcript="Увімкни Bluetooth"))
+    assert result["action"] == "system_toggle"
+    assert result["params"] == {"feature": "bluetooth", "state": "on"}
+
+    result = orchestrator.process_request(build_payload(transcript="Вимкни режим польоту"))
+    assert result["params"] == {"feature": "airplane_mode", "state": "off"}
+
+    # With several toggles in one utterance the leftmost one wins.
+    result = orchestrator.process_request(
+        build_payload(transcript="Вимкни bluetooth і увімкни wi-fi")
+    )
+    assert result["params"] == {"feature": "bluetooth", "state": "off"}
+
+    # Any run of whitespace may separate the verb from the feature.
+    result = orchestrator.process_request(build_payload(transcript="Вимкни   вайфай"))
+    assert result["params"] == {"feature": "wifi", "state": "off"}
+
+    result = orchestrator.process_request(
+        build_payload(transcript="Будь ласка, вставити текст: вимкни    вайфай")
+    )
+    assert result["action"] == "system_toggle"
+
+
+def test_unknown_app_asks_for_more_info():
+    payload = build_payload(transcript="Запусти невідомо що")
+    result = orchestrator.process_request(payload)
+    assert result["action"] == "none"
+    assert result["need_more_info"] == "Не знайшла додаток. Уточніть назву."
+    assert result["confirmation"]["required"] is False
+    assert result["log"]["slots"] == {"app": "невідомо що"}
+
+
+def test_delete_file_requires_confirmation():
+    payload = build_payload(transcript="Видали файл звіт.docx")
+    result = orchestrator.process_request(payload)
+    assert result["action"] == "none"
+    assert result["params"] == {"file": "звіт.docx"}
+    assert result["confirmation"] == {"required": True, "phrase": "Видалити файл звіт.docx?"}
+    assert result["log"]["resolution"] == {"critical_intent": "delete_file"}
+
+
+def test_hotkey_combo_is_split_on_plus_and_spaces():
+    payload = build_payload(transcript="Натисни Ctrl + Shift+Esc")
+    result = orchestrator.process_request(payload)
+    assert result["action"] == "hotkey"
+    assert result["params"]["keys"] == ["ctrl", "shift", "esc"]
+    assert result["log"]["slots"]["keys"] == "Ctrl+Shift+Esc"
+
+
+def test_unrecognized_command_is_reported_unknown():
+    payload = build_payload(transcript="Яка сьогодні погода")
+    result = orchestrator.process_request(payload)
+    assert result["action"] == "none"
+    assert result["log"]["intent_detected"] == "unknown"
+    assert result["log"]["errors"] == ["intent_not_found"]
+
+
+def test_tts_limit_truncates_with_ellipsis():
+    assert orchestrator._apply_tts_limit("Короткий", None) == "Короткий"
+    assert orchestrator._apply_tts_limit("абвгд", 5) == "абвгд"
+    assert orchestrator._apply_tts_limit("абвгдеж", 5) == "абвг…"
+    assert orchestrator._apply_tts_limit("абв дежз", 5) == "абв…"
+    assert orchestrator._apply_tts_limit("x", 0) == "…"
+
+
+def test_speak_results_summarizes_top_items():
+    payload = build_payload(
+        transcript="Озвуч результати",
+        result_set=[
+            {"title": "Перший", "snippet": "опис"},
+            {"snippet": "без заголовка"},
+            {"name": "Другий"},
+        ],
+    )
+    result = orchestrator.process_request(payload)
+    assert result["action"] == "speak_results"
+    assert result["tts"]["say"] == "Перший: опис; Другий"
+    assert orchestrator._summarize_result_set([{"snippet": "x"}]) == "Результати без опису."
+
+
+def test_cli_rejects_invalid_json(monkeypatch, capsys):
+    monkeypatch.setattr(sys, "stdin", io.StringIO("{не json"))
+    assert orchestrator.main() == 2
+    assert "Помилка читання JSON" in capsys.readouterr().err
+
+
+def test_close_window_phrase_maps_to_alt_f4():
+    payload = build_payload(transcript="Закрий вікно")
+    result = orchestrator.process_request(payload)
+    assert result["action"] == "hotkey"
+    assert result["params"]["keys"] == ["alt", "f4"]
+    assert result["log"]["slots"]["keys"] == "Alt+F4"
+
+
+def test_cli_preserves_large_integer_ids(monkeypatch, capsys):
+    app_id = 123456789012345678901234567890
+    payload = build_payload(
+        transcript="Запусти Notepad",
+        apps=[{"id": app_id, "name": "Notepad", "path": "C:/Windows/notepad.exe"}],
+    )
+    monkeypatch.setattr(sys, "stdin", io.StringIO(json.dumps(payload, ensure_ascii=False)))
+    assert orchestrator.main() == 0
+
+    output = json.loads(capsys.readouterr().out)
+    assert output["log"]["resolution"]["app_id"] == app_id
+
+
+def test_unrelated_catalog_entries_do_not_break_requests():
+    payload = build_payload(
+        transcript="Пошук погода",
+        windows=[{"id": 1, "title": 7}],
+    )
+    result = orchestrator.process_request(payload)
+    assert result["action"] == "web_search"
+
+
+def test_non_string_catalog_names_are_skipped():
+    payload = build_payload(
+        transcript="Перемкнись на Браузер",
+        windows=[{"id": 1, "title": 7}, {"id": 2, "name": "Браузер"}],
+    )
+    result = orchestrator.process_request(payload)
+    assert result["action"] == "focus_window"
+    assert result["params"]["id"] == 2
+
+
+INTENT_SAMPLES = {
+    "run_app": "Запусти Notepad",
+    "focus_window": "Перейди на Браузер",
+    "hotkey": "Згорни всі вікна",
+    "audio_control": "Без звуку",
+    "system_toggle": "Увімкни вайфай",
+    "open_folder": "Відкрий папку Документи",
+    "file_search": "Знайди файл звіт",
+    "file_list": "Покажи файли за вчора",
+    "mkdir_here": "Створи папку Нова тут",
+    "open_recent": "Відкрий останній файл",
+    "text_input": "Вставити текст привіт",
+    "web_search": "Знайди в інтернеті погода",
+    "speak_results": "Прочитай результати",
+    "run_macro": "Увімкнути режим фокус",
+    "llm_summarize": "Підсумуй",
+    "llm_query": "Що таке квазар",
+}
+
+
+@pytest.mark.parametrize("intent, handler", orchestrator.INTENT_HANDLERS)
+def test_intent_gate_admits_every_handler(intent, handler):
+    # A handler whose trigger words are missing from _INTENT_GATE would make
+    # its commands silently fall through to "unknown".
+    transcript = INTENT_SAMPLES[intent].lower()
+    payload = build_payload(transcript=transcript, result_set=[{"title": "Результат"}])
+    assert orchestrator._INTENT_GATE.search(transcript)
+    assert handler(
+        transcript,
+        payload,
+        result_set=payload["result_set"],
+    )
+
+
+def test_every_handler_has_triggers_and_a_leading_verb():
+    handler_intents = [intent for intent, _handler in orchestrator.INTENT_HANDLERS]
+    assert list(orchestrator._INTENT_TRIGGERS) == handler_intents
+    dispatched = {
+        intent
+        for intents in orchestrator._TRIGGER_VERBS.values()
+        for intent in intents
+    }
+    assert dispatched == set(handler_intents)
+
+
+def test_shutdown_takes_priority_over_other_critical_phrases():
+    payload = build_payload(transcript="Видали файл звіт і вимкни комп'ютер")
+    result = orchestrator.process_request(payload)
+    assert result["confirmation"] == {"required": True, "phrase": "Вимкнути комп'ютер?"}
+    assert result["log"]["resolution"] == {"critical_intent": "shutdown"}
+
+    payload = build_payload(transcript="Видали файл звіт і перезавантаж")
+    result = orchestrator.process_request(payload)
+    assert result["log"]["resolution"] == {"critical_intent": "restart"}